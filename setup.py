@@ -1,8 +1,5 @@
 #!/usr/bin/env python
 # -*- encoding: utf-8 -*-
-from __future__ import absolute_import
-from __future__ import print_function
-
 from glob import glob
 from os.path import basename
 from os.path import dirname
@@ -28,7 +25,8 @@ setup(name='openpyxl-helpers',
       license='BSD',
       packages=find_packages('src'),
       package_dir={'': 'src'},
-      install_requires=['lxml', 'openpyxl', 'path-helpers'],
+      install_requires=['lxml', 'openpyxl>=2.6', 'path-helpers'],
+      python_requires='>=3.7',
       py_modules=[splitext(basename(path))[0] for path in glob('src/*.py')],
       # Install data listed in `MANIFEST.in`
       include_package_data=True)
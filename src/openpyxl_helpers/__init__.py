@@ -1,14 +1,20 @@
+import collections
+import contextlib
 import logging
 import io
-import itertools as it
+import os
+import struct
+import threading
 import zipfile
 
-import lxml
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+import lxml.etree
 import openpyxl as ox
-import pandas as pd
 import path_helpers as ph
 
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
 from ._version import get_versions
 __version__ = get_versions()['version']
 del get_versions
@@ -20,8 +26,623 @@ EXCEL_NAMESPACES = {k: getattr(ox.xml.constants, k)
                     for k in ('SHEET_MAIN_NS', 'REL_NS', 'PKG_REL_NS',
                               'CONTYPES_NS')}
 
+# Qualified names of worksheet XML elements, i.e., ``{namespace}name``.
+_SHEET_MAIN_NS = EXCEL_NAMESPACES['SHEET_MAIN_NS']
+_WORKSHEET_TAG = '{%s}worksheet' % _SHEET_MAIN_NS
+_EXTLST_TAG = '{%s}extLst' % _SHEET_MAIN_NS
+_DATA_VALIDATIONS_TAG = '{%s}dataValidations' % _SHEET_MAIN_NS
+_DRAWING_TAG = '{%s}drawing' % _SHEET_MAIN_NS
+_ROW_TAG = '{%s}row' % _SHEET_MAIN_NS
+
+# Lock serializing opening and closing of ZIP members read by worker threads,
+# see :func:`_open_zip_member`.
+_ZIP_MEMBER_LOCK = threading.Lock()
+
+# Content type overrides for the content type bound to `$content_type`
+# (compiled once).
+_XPATH_CONTENT_TYPE_OVERRIDES = \
+    lxml.etree.XPath('ct:Override[@ContentType=$content_type]',
+                     namespaces={'ct': EXCEL_NAMESPACES['CONTYPES_NS']})
+
+# Directories containing chart-related files, see :func:`load_charts`.
+_CHART_PREFIXES = ('xl/charts/', 'xl/chartsheets/', 'xl/drawings/',
+                   'xl/worksheets/_rels/')
+
+# Parser shared by all XML documents parsed from a workbook.
+#
+# Worksheet XML does not use `xml:id` attributes, and may exceed the default
+# `libxml2` limits on document size for large worksheets.  Package parts do
+# not use (external) entities.
+_XML_PARSER_OPTIONS = {'collect_ids': False, 'huge_tree': True,
+                       'resolve_entities': False, 'no_network': True}
+_XML_PARSER = lxml.etree.XMLParser(**_XML_PARSER_OPTIONS)
+
+# Serialization options for XML documents written to a workbook.
+#
+# Excel writes package parts as UTF-8 with a standalone XML declaration.  The
+# `lxml` default (ASCII, no declaration) escapes every non-ASCII character.
+_XML_WRITE_OPTIONS = {'xml_declaration': True, 'encoding': 'UTF-8',
+                      'standalone': True}
+
+
+def _open_xlsx(xlsx_path):
+    '''
+    Open Excel ``xlsx`` ZIP file for reading.
+
+    Parameters
+    ----------
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        Context manager providing ``zipfile.ZipFile`` open for reading.
+
+        If :data:`xlsx_path` is a ``zipfile.ZipFile``, it is provided as-is
+        and is **not** closed on exit.
+    '''
+    if isinstance(xlsx_path, zipfile.ZipFile):
+        return contextlib.nullcontext(xlsx_path)
+    return zipfile.ZipFile(xlsx_path, mode='r')
+
+
+@contextlib.contextmanager
+def _open_output_zip(output, compresslevel):
+    '''
+    Open output Excel ``xlsx`` ZIP file for writing.
+
+    If an exception is raised within the context, the ZIP central directory
+    is **not** written (i.e., no partial, valid-looking archive is produced)
+    and, if :data:`output` is a path, the output file is removed.
+
+    Parameters
+    ----------
+    output : str or file-like
+        Output path or file-like object.
+    compresslevel : int
+        Compression level (``0``-``9``) for files written to the archive.
+
+    Yields
+    ------
+    zipfile.ZipFile
+        ZIP file open for writing.
+    '''
+    output_zip = zipfile.ZipFile(output, mode='w',
+                                 compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=compresslevel)
+    try:
+        yield output_zip
+    except BaseException:
+        # `ZipFile.close()` only writes the central directory if the archive
+        # was modified.
+        output_zip._didModify = False
+        output_zip.close()
+        if isinstance(output, (str, os.PathLike)):
+            os.remove(output)
+        raise
+    else:
+        output_zip.close()
+
+
+@contextlib.contextmanager
+def _open_zip_member(zip_file, zip_info):
+    '''
+    Open ZIP member for reading, where the ``ZipFile`` is shared by multiple
+    threads.
+
+    ``ZipFile.open()`` and closing the returned member update the reference
+    count of the underlying file *without* holding the ``ZipFile`` lock, so
+    concurrent calls may, e.g., close the underlying file early.  Opening and
+    closing are therefore serialized, while reads (which ``ZipFile``
+    serializes internally) and decompression may run concurrently.
+
+    Parameters
+    ----------
+    zip_file : zipfile.ZipFile
+        ZIP file open for reading.
+    zip_info : zipfile.ZipInfo
+        Information of member of :data:`zip_file` to open.
+
+    Yields
+    ------
+    zipfile.ZipExtFile
+        File-like object for reading member contents.
+    '''
+    with _ZIP_MEMBER_LOCK:
+        data = zip_file.open(zip_info)
+    try:
+        yield data
+    finally:
+        with _ZIP_MEMBER_LOCK:
+            data.close()
+
+
+def _worksheet_zip_infos(zip_file):
+    '''
+    List worksheet members of an Excel ``xlsx`` ZIP file.
+
+    Parameters
+    ----------
+    zip_file : zipfile.ZipFile
+        Excel ``xlsx`` ZIP file.
+
+    Returns
+    -------
+    list[zipfile.ZipInfo]
+        Information of each worksheet file (i.e., each file directly in the
+        ``xl/worksheets/`` directory) in :data:`zip_file`.
+    '''
+    return [zip_info_i
+            for filename_i, zip_info_i in zip_file.NameToInfo.items()
+            if filename_i.startswith('xl/worksheets/') and
+            '/' not in filename_i[14:]]
+
+
+def _copy_zip_info(zip_info, compresslevel=None):
+    '''
+    Create ``ZipInfo`` for writing a copy of a ZIP member to another ZIP file.
+
+    The source ``ZipInfo`` may not be passed to ``ZipFile.open(..., mode='w')``
+    directly, since writing updates attributes (e.g., ``header_offset``) that
+    are needed to read the member from the source ZIP file.
+
+    Parameters
+    ----------
+    zip_info : zipfile.ZipInfo
+        Source ZIP member information.
+    compresslevel : int, optional
+        Compression level to use when writing the member.
+
+        Note that ``ZipFile.open()`` and ``ZipFile.writestr()`` do not apply
+        the ``ZipFile`` compression level to members specified by
+        ``ZipInfo``.
+
+    Returns
+    -------
+    zipfile.ZipInfo
+        New ZIP member information with the same name, timestamp, compression
+        type, attributes, and (uncompressed) size as :data:`zip_info`.
+    '''
+    zip_info_copy = zipfile.ZipInfo(zip_info.filename, zip_info.date_time)
+    zip_info_copy.compress_type = zip_info.compress_type
+    zip_info_copy.external_attr = zip_info.external_attr
+    # Used by `ZipFile.open()` to decide whether a ZIP64 header is required.
+    zip_info_copy.file_size = zip_info.file_size
+    if compresslevel is not None:
+        zip_info_copy._compresslevel = compresslevel
+    return zip_info_copy
+
+
+def _copy_zip_member(input_zip, output_zip, zip_info):
+    '''
+    Copy ZIP member to another ZIP file without decompressing it.
+
+    The compressed member data are copied as-is, avoiding a decompress and
+    recompress round trip for members that are not modified.
+
+    Note that ``zipfile`` does not provide a public API for writing
+    compressed data directly, so the output ZIP file is updated the same way
+    as in ``ZipFile.write()``.
+
+    Parameters
+    ----------
+    input_zip : zipfile.ZipFile
+        ZIP file open for reading.
+    output_zip : zipfile.ZipFile
+        ZIP file open for writing.
+    zip_info : zipfile.ZipInfo
+        Information of member of :data:`input_zip` to copy.
+    '''
+    zip_info_copy = _copy_zip_info(zip_info)
+    zip_info_copy.CRC = zip_info.CRC
+    zip_info_copy.compress_size = zip_info.compress_size
+    # Sizes and CRC are written to the local file header, so no data
+    # descriptor follows the member data.
+    zip_info_copy.flag_bits = zip_info.flag_bits & ~0x08
+    zip64 = (zip_info.file_size > zipfile.ZIP64_LIMIT or
+             zip_info.compress_size > zipfile.ZIP64_LIMIT)
+
+    with input_zip._lock, output_zip._lock:
+        # Skip local file header of input member.
+        input_zip.fp.seek(zip_info.header_offset)
+        header = struct.unpack(zipfile.structFileHeader,
+                               input_zip.fp.read(zipfile.sizeFileHeader))
+        # Skip variable length file name and extra field.
+        input_zip.fp.seek(header[10] + header[11], io.SEEK_CUR)
+
+        output_zip._writecheck(zip_info_copy)
+        output_zip._didModify = True
+        if output_zip._seekable:
+            output_zip.fp.seek(output_zip.start_dir)
+        zip_info_copy.header_offset = output_zip.fp.tell()
+        output_zip.fp.write(zip_info_copy.FileHeader(zip64))
+
+        remaining = zip_info.compress_size
+        while remaining > 0:
+            data = input_zip.fp.read(min(remaining, 64 << 10))
+            if not data:
+                raise zipfile.BadZipfile('Truncated ZIP member: %s' %
+                                         zip_info.filename)
+            output_zip.fp.write(data)
+            remaining -= len(data)
+
+        output_zip.filelist.append(zip_info_copy)
+        output_zip.NameToInfo[zip_info_copy.filename] = zip_info_copy
+        output_zip.start_dir = output_zip.fp.tell()
+
+
+def _has_opaque_markup(worksheet_xml):
+    '''
+    Check whether XML document contains comments, CDATA sections, or
+    processing instructions (other than the XML declaration).
+
+    Tags that occur within such markup are not elements, so the byte-level
+    scans for tags (see, e.g., :func:`_set_worksheet_child`) may only be
+    trusted if this function returns ``False``.
+
+    Parameters
+    ----------
+    worksheet_xml : bytes
+        XML document.
+
+    Returns
+    -------
+    bool
+        ``True`` if the document contains comments, CDATA sections, or
+        processing instructions.
+    '''
+    if worksheet_xml.startswith((b'<?xml', b'\xef\xbb\xbf<?xml')):
+        # Skip XML declaration.
+        body_start = worksheet_xml.find(b'?>') + 2
+    else:
+        body_start = 0
+    return (b'<!--' in worksheet_xml or b'<![CDATA[' in worksheet_xml or
+            worksheet_xml.find(b'<?', body_start) >= 0)
+
+
+def _find_extension_list(worksheet_xml):
+    '''
+    Find extension list element of a worksheet XML document.
+
+    The extension list, if present, is the last child of the root
+    ``worksheet`` element, so the document is scanned *backwards* for the
+    ``extLst`` element and only that fragment is parsed.  The bulk of the
+    worksheet (e.g., ``sheetData``) is never parsed.
+
+    If the result of the backward scan is ambiguous (e.g., the root element
+    uses a namespace prefix, an ``extLst`` element is nested within another
+    element, or the document contains comments or CDATA sections, see
+    :func:`_has_opaque_markup`), the document is scanned using
+    :func:`_find_worksheet_child` instead.
+
+    Parameters
+    ----------
+    worksheet_xml : bytes
+        Worksheet XML document.
+
+    Returns
+    -------
+    lxml.etree._Element
+        Extension list element (or ``None`` if the worksheet does not contain
+        an extension list).
+    '''
+    end = worksheet_xml.rfind(b'</worksheet>')
+    if end >= 0:
+        start = worksheet_xml.rfind(b'<extLst', 0, end)
+        if start < 0:
+            if b'extLst' not in worksheet_xml:
+                # Worksheet does not contain any extension list.
+                return None
+            # Extension list may use a namespace prefix (e.g., `<x:extLst>`).
+        elif not _has_opaque_markup(worksheet_xml):
+            # Parse extension list fragment within root element start tag
+            # (which declares the namespaces used in the worksheet).
+            root_start = worksheet_xml.find(b'<worksheet')
+            root_end = worksheet_xml.find(b'>', root_start) + 1
+            fragment = b''.join([worksheet_xml[root_start:root_end],
+                                 worksheet_xml[start:end], b'</worksheet>'])
+            try:
+                root = lxml.etree.fromstring(fragment, _XML_PARSER)
+            except lxml.etree.XMLSyntaxError:
+                pass
+            else:
+                if len(root) == 1 and root[0].tag == _EXTLST_TAG:
+                    return root[0]
+    return _find_worksheet_child(io.BytesIO(worksheet_xml), _EXTLST_TAG)
+
+
+def _find_worksheet_child(source, tag):
+    '''
+    Find direct child element of the root ``worksheet`` element of a worksheet
+    XML document.
+
+    The document is parsed incrementally (using :func:`lxml.etree.iterparse`)
+    and rows are discarded as soon as they are parsed, i.e., the full
+    worksheet tree is never held in memory.  Only ``end`` events for rows and
+    for elements matching :data:`tag` are reported to Python, so cells and
+    values are handled entirely in C.
+
+    Parameters
+    ----------
+    source : file-like
+        Worksheet XML document.
+    tag : str
+        Qualified tag name (i.e., ``{namespace}name``) of child element.
+
+    Returns
+    -------
+    lxml.etree._Element
+        First matching child element of the root ``worksheet`` element (or
+        ``None`` if the worksheet does not contain a matching element).
+    '''
+    for event, element in lxml.etree.iterparse(source, events=('end', ),
+                                               tag=(tag, _ROW_TAG),
+                                               **_XML_PARSER_OPTIONS):
+        parent = element.getparent()
+        if element.tag == _ROW_TAG:
+            # Cell data is never needed.  Free memory used by rows that have
+            # already been scanned.
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+        elif parent is not None and parent.getparent() is None:
+            # Element is a direct child of the root element.
+            return element
+    return None
+
+
+def _append_worksheet_child(worksheet_xml, element):
+    '''
+    Append child element to the root ``worksheet`` element of a worksheet XML
+    document.
+
+    The serialized element is inserted directly before the closing
+    ``</worksheet>`` tag, i.e., the (potentially very large) worksheet
+    document is not parsed or re-serialized.  If the closing tag is not found
+    (e.g., the root element uses a namespace prefix) or the document contains
+    comments or CDATA sections (see :func:`_has_opaque_markup`), the document
+    is parsed and modified using ``lxml`` instead.
+
+    Parameters
+    ----------
+    worksheet_xml : bytes
+        Worksheet XML document.
+    element : lxml.etree._Element
+        Element to append.
+
+    Returns
+    -------
+    bytes
+        Modified worksheet XML document.
+    '''
+    end = worksheet_xml.rfind(b'</worksheet>')
+    if end < 0 or _has_opaque_markup(worksheet_xml):
+        # Closing tag not found, or may be within, e.g., a trailing comment.
+        root = _parse_worksheet(worksheet_xml)
+        root.append(element)
+        return lxml.etree.tostring(root.getroottree(),
+                                   **_XML_WRITE_OPTIONS)
+    return b''.join([worksheet_xml[:end],
+                     lxml.etree.tostring(element, with_tail=False),
+                     worksheet_xml[end:]])
+
+
+def _set_worksheet_child(worksheet_xml, element):
+    '''
+    Replace child element of the root ``worksheet`` element of a worksheet
+    XML document with the same tag as :data:`element`, or append
+    :data:`element` if the worksheet has no such child element.
+
+    The existing element is located by scanning the document bytes for its
+    start tag and the serialized element is spliced in its place (see
+    :func:`_append_worksheet_child`), i.e., the (potentially very large)
+    worksheet document is not parsed or re-serialized.  If the result of the
+    scan is ambiguous (e.g., the matching element uses a namespace prefix or
+    is nested within another element, or the document contains comments or
+    CDATA sections, see :func:`_has_opaque_markup`), the document is parsed
+    and modified using ``lxml`` instead.
+
+    Parameters
+    ----------
+    worksheet_xml : bytes
+        Worksheet XML document.
+    element : lxml.etree._Element
+        Element to set.
+
+    Returns
+    -------
+    bytes
+        Modified worksheet XML document.
+    '''
+    name = lxml.etree.QName(element).localname.encode('utf8')
+    root_start = worksheet_xml.find(b'<worksheet')
+    start = worksheet_xml.find(b'<' + name, max(root_start, 0))
+    if root_start >= 0 and start < 0 and name not in worksheet_xml:
+        # Worksheet does not contain a matching element.
+        return _append_worksheet_child(worksheet_xml, element)
+    elif root_start >= 0 and start >= 0 and \
+            worksheet_xml[start + len(name) + 1:][:1] in b' \t\r\n/>' and \
+            not _has_opaque_markup(worksheet_xml):
+        start_end = worksheet_xml.find(b'>', start) + 1
+        if worksheet_xml[start_end - 2:start_end] == b'/>':
+            # Empty element.
+            end = start_end
+        else:
+            end = worksheet_xml.find(b'</' + name + b'>', start)
+            end = -1 if end < 0 else end + len(name) + 3
+        if end > 0:
+            # Parse existing element fragment within root element start tag
+            # (which declares the namespaces used in the worksheet).
+            root_end = worksheet_xml.find(b'>', root_start) + 1
+            fragment = b''.join([worksheet_xml[root_start:root_end],
+                                 worksheet_xml[start:end], b'</worksheet>'])
+            try:
+                root = lxml.etree.fromstring(fragment, _XML_PARSER)
+            except lxml.etree.XMLSyntaxError:
+                pass
+            else:
+                if root.tag == _WORKSHEET_TAG and len(root) == 1 and \
+                        root[0].tag == element.tag:
+                    return b''.join([worksheet_xml[:start],
+                                     lxml.etree.tostring(element,
+                                                         with_tail=False),
+                                     worksheet_xml[end:]])
+
+    root = _parse_worksheet(worksheet_xml)
+    existing = root.find(element.tag)
+    if existing is not None:
+        root.replace(existing, element)
+    else:
+        root.append(element)
+    return lxml.etree.tostring(root.getroottree(),
+                               **_XML_WRITE_OPTIONS)
+
+
+def _parse_worksheet(worksheet_xml):
+    '''
+    Parse worksheet XML document.
+
+    Parameters
+    ----------
+    worksheet_xml : bytes
+        Worksheet XML document.
+
+    Returns
+    -------
+    lxml.etree._Element
+        Root ``worksheet`` element.
+
+    Raises
+    ------
+    ValueError
+        If the root element of the document is not a ``worksheet`` element.
+    '''
+    root = lxml.etree.fromstring(worksheet_xml, _XML_PARSER)
+    if root.tag != _WORKSHEET_TAG:
+        raise ValueError('Not a worksheet document (root element: `%s`).'
+                         % root.tag)
+    return root
+
+
+def _load_worksheets(input_zip, load, max_workers):
+    '''
+    Load data from each worksheet in an Excel ``xlsx`` ZIP file.
+
+    Worksheets are independent, and decompression, scanning, and parsing
+    mostly run in C code, so worksheets are processed concurrently.
+
+    Note that all threads share :data:`input_zip`.  Members are opened and
+    closed using :func:`_open_zip_member`.
+
+    Parameters
+    ----------
+    input_zip : zipfile.ZipFile
+        Excel ``xlsx`` ZIP file open for reading.
+    load : function
+        Function returning data, given worksheet file-like object.
+    max_workers : int
+        Maximum number of worksheets to process concurrently.
+
+    Returns
+    -------
+    dict
+        Mapping from each worksheet filepath in Excel ZIP file to
+        corresponding data returned by :data:`load`.
+    '''
+    def load_worksheet(zip_info):
+        with _open_zip_member(input_zip, zip_info) as data:
+            return load(data)
+
+    zip_infos = _worksheet_zip_infos(input_zip)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip([zip_info_i.filename for zip_info_i in zip_infos],
+                        executor.map(load_worksheet, zip_infos)))
+
+
+def _update_worksheets(xlsx_path, elements, output, compresslevel,
+                       max_workers, update):
+    '''
+    Write copy of Excel ``xlsx`` file with modified worksheets.
+
+    Modified worksheets are decompressed and updated concurrently (see
+    :func:`_load_worksheets`), while members are written to the output
+    file in their original order.  At most :data:`max_workers` modified
+    worksheets are processed ahead of the writer, to bound memory usage.
+    Members that are not modified are copied without being decompressed.
+
+    Parameters
+    ----------
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading.
+    elements : dict
+        Mapping from each worksheet filepath in Excel ZIP file to
+        corresponding XML element (or ``None`` to leave worksheet unmodified).
+    output : str or file-like
+        Output path or file-like object to write modified Excel ``.xlsx`` file
+        to.
+    compresslevel : int
+        Compression level (``0``-``9``) for modified files.
+    max_workers : int
+        Maximum number of worksheets to update concurrently (or ``None`` for
+        ``min(32, os.cpu_count() + 4)``).
+    update : function
+        Function returning modified worksheet XML document, given the original
+        worksheet XML document (as bytes) and the corresponding element from
+        :data:`elements`.
+    '''
+    def update_worksheet(zip_info, element):
+        with _open_zip_member(input_, zip_info) as data:
+            return update(data.read(), element)
+
+    if max_workers is None:
+        # Same default as `ThreadPoolExecutor` (Python 3.8+).  The number of
+        # workers is also the bound on worksheets processed ahead of the
+        # writer (see below).
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    # Open input file first, so no output is written if it cannot be read.
+    with _open_xlsx(xlsx_path) as input_, \
+            _open_output_zip(output, compresslevel) as output_zip, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Modified worksheets, in archive order.
+        modified = iter([zip_info_i for zip_info_i in input_.infolist()
+                         if elements.get(zip_info_i.filename) is not None])
+        # Future contents of the next modified worksheets (in archive order).
+        #
+        # At most `max_workers` worksheets are submitted ahead of the writer,
+        # so only a bounded number of modified worksheets are held in memory.
+        #
+        # Note that `ZipFile` serializes reads from the underlying input file
+        # (and `_copy_zip_member()` holds the same lock), so members may be
+        # read by worker threads while other members are copied.
+        pending = collections.deque()
+
+        def submit_next():
+            zip_info = next(modified, None)
+            if zip_info is not None:
+                pending.append((zip_info.filename,
+                                executor.submit(update_worksheet, zip_info,
+                                                elements[zip_info.filename])))
+
+        for _ in range(max_workers):
+            submit_next()
+
+        for zip_info_i in input_.infolist():
+            if not pending or pending[0][0] != zip_info_i.filename:
+                # Copy original (compressed) file contents.
+                _copy_zip_member(input_, output_zip, zip_info_i)
+                continue
+            logger.debug('Update: %s', zip_info_i.filename)
+            contents_i = pending.popleft()[1].result()
+            submit_next()
+            output_zip.writestr(_copy_zip_info(zip_info_i, compresslevel),
+                                contents_i)
+
 
-def load_extension_lists(xlsx_path):
+def load_extension_lists(xlsx_path, max_workers=None):
     '''
     Load extension list for each worksheet in an Excel spreadsheet.
 
@@ -37,6 +658,11 @@ def load_extension_lists(xlsx_path):
 
     .. versionadded:: 0.2
 
+    .. versionchanged:: 0.7
+        Add :data:`max_workers` keyword argument.  Worksheets are processed
+        concurrently.
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     See also
     --------
     :func:`update_extension_lists` :func:`update_data_validations`,
@@ -44,8 +670,15 @@ def load_extension_lists(xlsx_path):
 
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, or seekable file-like object containing
+        Excel ``xlsx`` file contents (e.g., an ``io.BytesIO`` instance, to
+        avoid reading the file from disk more than once when loading and
+        updating the same workbook), or Excel ``xlsx`` ZIP file open for
+        reading (to also avoid reading the ZIP directory more than once).
+    max_workers : int, optional
+        Maximum number of worksheets to process concurrently (default:
+        ``concurrent.futures.ThreadPoolExecutor`` default).
 
     Returns
     -------
@@ -54,34 +687,17 @@ def load_extension_lists(xlsx_path):
         corresponding extension list XML element (or ``None`` if the
         worksheet does not contain any extension list element).
     '''
-    extension_lists = {}
-
     # Open Excel file.
-    with zipfile.ZipFile(xlsx_path, mode='r') as input_:
-        # Get mapping from each worksheet filename to corresponding `ZipInfo`
-        # object.
-        zip_info_by_filenames = {ph.path(v.filename): v
-                                 for v in input_.filelist}
-
-        # Extract extension list XML element (if present) from each worksheet.
-        for filename_i, zip_info_i in zip_info_by_filenames.iteritems():
-            if filename_i.parent != 'xl/worksheets':
-                continue
-            with io.BytesIO(input_.read(filename_i)) as data_i:
-                worksheet_root_i = lxml.etree.parse(data_i)
-            extension_lists_i = (worksheet_root_i
-                                 .xpath('/SHEET_MAIN_NS:worksheet'
-                                        '/SHEET_MAIN_NS:extLst',
-                                        namespaces=EXCEL_NAMESPACES))
-            if extension_lists_i:
-                # This worksheet has an extension list.
-                extension_lists[filename_i] = extension_lists_i[0]
-            else:
-                extension_lists[filename_i] = None
-    return extension_lists
+    with _open_xlsx(xlsx_path) as input_:
+        # Extract extension list XML element (or `None` if the worksheet does
+        # not contain an extension list) from each worksheet.
+        return _load_worksheets(input_, lambda data:
+                                _find_extension_list(data.read()),
+                                max_workers)
 
 
-def update_extension_lists(xlsx_path, extension_lists):
+def update_extension_lists(xlsx_path, extension_lists, output=None,
+                           compresslevel=1, max_workers=None):
     '''
     Update extension list for worksheets in an Excel spreadsheet.
 
@@ -97,6 +713,13 @@ def update_extension_lists(xlsx_path, extension_lists):
 
     .. versionadded:: 0.2
 
+    .. versionchanged:: 0.7
+        Add :data:`output`, :data:`compresslevel`, and :data:`max_workers`
+        keyword arguments.  Files that are not modified are copied to the
+        output file without being decompressed, and worksheets are updated
+        concurrently.
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     See also
     --------
     :func:`load_extension_lists` :func:`update_data_validations`,
@@ -104,57 +727,55 @@ def update_extension_lists(xlsx_path, extension_lists):
 
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, or seekable file-like object containing
+        Excel ``xlsx`` file contents (e.g., an ``io.BytesIO`` instance, to
+        avoid reading the file from disk more than once when loading and
+        updating the same workbook), or Excel ``xlsx`` ZIP file open for
+        reading (to also avoid reading the ZIP directory more than once).
     extension_lists : dict
         Mapping from each worksheet filepath in Excel ZIP file to
         corresponding extension list XML element.
+    output : str or file-like, optional
+        Output path or file-like object to write modified Excel ``.xlsx`` file
+        to.
+    compresslevel : int, optional
+        Compression level (``0``-``9``) for modified files (default: ``1``,
+        i.e., fastest).  Files that are not modified keep their original
+        compression.
+    max_workers : int, optional
+        Maximum number of worksheets to update concurrently (default:
+        ``concurrent.futures.ThreadPoolExecutor`` default).
 
     Returns
     -------
     bytes
-        Modified Excel ``.xlsx`` file contents as a bytes string.
-    '''
-    with io.BytesIO() as output:
-        with zipfile.ZipFile(output, mode='a',
-                             compression=zipfile.ZIP_DEFLATED) as output_zip:
-            # - Read existing file
-            # - Append extension list from template file to worksheet XML.
-            # - Copy all files except for `worksheet1` to in-memory zip file.
-            with zipfile.ZipFile(xlsx_path, mode='r') as input_:
-                zip_infos_by_filename = {ph.path(v.filename): v
-                                         for v in input_.filelist}
-                for filename_i, zip_info_i in zip_infos_by_filename.iteritems():
-                    extension_list_i = extension_lists.get(filename_i)
-
-                    if extension_list_i is None or (filename_i not in
-                                                    extension_lists):
-                        # Worksheet file has no extension list.  Use original
-                        # worksheet contents.
-                        contents_i = input_.read(filename_i)
-                    else:
-                        # Worksheet file has **extension list**.
-                        # Load worksheet file XML contents from `xlsx_path`
-                        # file.
-                        with io.BytesIO(input_.read(filename_i)) as data:
-                            root_i = lxml.etree.parse(data)
-                        # Get root worksheet XML element.
-                        worksheet_i = \
-                            root_i.xpath('/SHEET_MAIN_NS:worksheet',
-                                         namespaces=EXCEL_NAMESPACES)[0]
-                        # Append the extension list to the worksheet element.
-                        worksheet_i.append(extension_list_i)
-                        # Use modified worksheet contents with extension list
-                        # added.
-                        contents_i = lxml.etree.tostring(root_i)
-                    # Write worksheet contents to output zip.
-                    output_zip.writestr(filename_i, contents_i,
-                                        zip_info_i.compress_type)
-            output_zip.close()
-        return output.getvalue()
-
-
-def load_data_validations(xlsx_path):
+        Modified Excel ``.xlsx`` file contents as a bytes string (only if
+        :data:`output` is not specified).
+    '''
+    if output is None:
+        if not isinstance(xlsx_path, zipfile.ZipFile) and \
+                all(extension_list_i is None
+                    for extension_list_i in extension_lists.values()):
+            # No extension lists to restore.  Return original file contents.
+            if hasattr(xlsx_path, 'read'):
+                xlsx_path.seek(0)
+                return xlsx_path.read()
+            with open(xlsx_path, 'rb') as input_:
+                return input_.read()
+        with io.BytesIO() as output:
+            update_extension_lists(xlsx_path, extension_lists, output=output,
+                                   compresslevel=compresslevel,
+                                   max_workers=max_workers)
+            return output.getvalue()
+
+    # Append extension list from template file to worksheet XML and copy all
+    # other files to output zip file.
+    _update_worksheets(xlsx_path, extension_lists, output, compresslevel,
+                       max_workers, _append_worksheet_child)
+
+
+def load_data_validations(xlsx_path, max_workers=None):
     '''
     Load data validations element for each worksheet in an Excel spreadsheet.
 
@@ -169,6 +790,11 @@ def load_data_validations(xlsx_path):
 
     .. versionadded:: 0.4
 
+    .. versionchanged:: 0.7
+        Add :data:`max_workers` keyword argument.  Worksheets are processed
+        concurrently.
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     See also
     --------
     :func:`update_data_validations`, :func:`load_extension_lists`,
@@ -176,8 +802,13 @@ def load_data_validations(xlsx_path):
 
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading (see
+        :func:`load_extension_lists`).
+    max_workers : int, optional
+        Maximum number of worksheets to process concurrently (default:
+        ``concurrent.futures.ThreadPoolExecutor`` default).
 
     Returns
     -------
@@ -186,35 +817,18 @@ def load_data_validations(xlsx_path):
         corresponding ``dataValidations`` XML element (or ``None`` if the
         worksheet does not contain any data validations element).
     '''
-    data_validations = {}
-
     # Open Excel file.
-    with zipfile.ZipFile(xlsx_path, mode='r') as input_:
-        # Get mapping from each worksheet filename to corresponding `ZipInfo`
-        # object.
-        zip_info_by_filenames = {ph.path(v.filename): v
-                                 for v in input_.filelist}
-
-        # Extract data validations XML element (if present) from each
-        # worksheet.
-        for filename_i, zip_info_i in zip_info_by_filenames.iteritems():
-            if filename_i.parent != 'xl/worksheets':
-                continue
-            with io.BytesIO(input_.read(filename_i)) as data_i:
-                worksheet_root_i = lxml.etree.parse(data_i)
-            data_validations_i = (worksheet_root_i
-                                  .xpath('/SHEET_MAIN_NS:worksheet'
-                                         '/SHEET_MAIN_NS:dataValidations',
-                                         namespaces=EXCEL_NAMESPACES))
-            if data_validations_i:
-                # This worksheet has a data validations element.
-                data_validations[filename_i] = data_validations_i[0]
-            else:
-                data_validations[filename_i] = None
-    return data_validations
+    with _open_xlsx(xlsx_path) as input_:
+        # Extract data validations XML element (or `None` if the worksheet
+        # does not contain a data validations element) from each worksheet.
+        return _load_worksheets(input_, lambda data:
+                                _find_worksheet_child(data,
+                                                      _DATA_VALIDATIONS_TAG),
+                                max_workers)
 
 
-def update_data_validations(xlsx_path, data_validations):
+def update_data_validations(xlsx_path, data_validations, output=None,
+                            compresslevel=1, max_workers=None):
     '''
     Update data validations for worksheets in an Excel spreadsheet.
 
@@ -228,6 +842,13 @@ def update_data_validations(xlsx_path, data_validations):
 
     .. versionadded:: 0.2
 
+    .. versionchanged:: 0.7
+        Add :data:`output`, :data:`compresslevel`, and :data:`max_workers`
+        keyword arguments.  Files that are not modified are copied to the
+        output file without being decompressed, and worksheets are updated
+        concurrently.
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     See also
     --------
     :func:`load_data_validations`, :func:`load_extension_lists`,
@@ -235,77 +856,61 @@ def update_data_validations(xlsx_path, data_validations):
 
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading (see
+        :func:`load_extension_lists`).
     data_validations : dict
         Mapping from each worksheet filepath in Excel ZIP file to
         corresponding data validations XML element.
+    output : str or file-like, optional
+        Output path or file-like object to write modified Excel ``.xlsx`` file
+        to.
+    compresslevel : int, optional
+        Compression level (``0``-``9``) for modified files (default: ``1``,
+        i.e., fastest; use ``9`` for smallest output).  Files that are not
+        modified keep their original compression.
+    max_workers : int, optional
+        Maximum number of worksheets to update concurrently (default:
+        ``concurrent.futures.ThreadPoolExecutor`` default).
 
     Returns
     -------
     bytes
-        Modified Excel ``.xlsx`` file contents as a bytes string.
-    '''
-    with io.BytesIO() as output:
-        with zipfile.ZipFile(output, mode='a',
-                             compression=zipfile.ZIP_DEFLATED) as output_zip:
-            # - Read existing file
-            # - Append data validations element from `data_validations` to
-            #   worksheet XML.
-            # - Copy all files except for `worksheet1` to in-memory zip file.
-            with zipfile.ZipFile(xlsx_path, mode='r') as input_:
-                zip_infos_by_filename = {ph.path(v.filename): v
-                                         for v in input_.filelist}
-                for filename_i, zip_info_i in zip_infos_by_filename.iteritems():
-                    data_validations_i = data_validations.get(filename_i)
-
-                    if data_validations_i is None or (filename_i not in
-                                                      data_validations):
-                        # Worksheet file has no data validations element.  Use
-                        # original worksheet contents.
-                        contents_i = input_.read(filename_i)
-                    else:
-                        # Worksheet file has **data validations element**.
-                        # Load worksheet file XML contents from `xlsx_path`
-                        # file.
-                        with io.BytesIO(input_.read(filename_i)) as data:
-                            root_i = lxml.etree.parse(data)
-                        # Get root worksheet XML element.
-                        worksheet_i = \
-                            root_i.xpath('/SHEET_MAIN_NS:worksheet',
-                                         namespaces=EXCEL_NAMESPACES)[0]
-
-                        existing_validations_i = \
-                            worksheet_i.xpath('//SHEET_MAIN_NS:dataValidations',
-                                              namespaces=EXCEL_NAMESPACES)
-
-                        if existing_validations_i:
-                            logger.debug('Replace existing data validation(s)')
-                            worksheet_i.replace(existing_validations_i[0],
-                                                data_validations_i)
-                        else:
-                            logger.debug('Append new data validation(s)')
-                            # Append the data validations element to the
-                            # worksheet element.
-                            worksheet_i.append(data_validations_i)
-                        # Use modified worksheet contents with data validations
-                        # element added.
-                        contents_i = lxml.etree.tostring(root_i)
-                    # Write worksheet contents to output zip.
-                    output_zip.writestr(filename_i, contents_i,
-                                        zip_info_i.compress_type)
-            output_zip.close()
-        return output.getvalue()
+        Modified Excel ``.xlsx`` file contents as a bytes string (only if
+        :data:`output` is not specified).
+    '''
+    if output is None:
+        with io.BytesIO() as output:
+            update_data_validations(xlsx_path, data_validations, output=output,
+                                    compresslevel=compresslevel,
+                                    max_workers=max_workers)
+            return output.getvalue()
+
+    # Replace existing data validations element (or append new data
+    # validations element) in worksheet XML and copy all other files to
+    # output zip file.
+    _update_worksheets(xlsx_path, data_validations, output, compresslevel,
+                       max_workers, _set_worksheet_child)
 
 
 def get_column_widths(worksheet, min_width=None):
     '''
     .. versionadded:: 0.2
 
+    .. versionchanged:: 0.7
+        Compute column widths in a single pass over existing cells (or, for
+        read-only worksheets, over cell values from
+        ``ReadOnlyWorksheet.iter_rows(values_only=True)``), instead of
+        sorting and grouping cell objects by column.
+
     Parameters
     ----------
     worksheet : openpyxl.worksheet.worksheet.Worksheet
         Excel worksheet.
+
+        A worksheet from a workbook loaded with
+        ``openpyxl.load_workbook(..., read_only=True)`` may also be used.
     min_width : int, optional
         Minimum column width in characters.
 
@@ -316,24 +921,61 @@ def get_column_widths(worksheet, min_width=None):
         cell to the corresponding column width to fit the widest entry in the
         column.
     '''
-    def column_key(x):
-        return x.column
-    column_widths = {column_i: max(max(len(str(cell_ij.value))
-                                       for cell_ij in cells_i),
-                                   min_width or 0)
-                     for column_i, cells_i in
-                     it.groupby(sorted(worksheet.get_cell_collection(),
-                                       key=column_key), key=column_key)}
-    return column_widths
+    min_width = min_width or 0
+    # Mapping from each column letter to width.
+    widths = collections.defaultdict(lambda: min_width)
+
+    if not isinstance(worksheet, ReadOnlyWorksheet):
+        # Regular worksheet.  Only visit cells that exist.
+        #
+        # Note that there is no public API for this: `iter_rows()` creates
+        # (and stores) an empty cell for every position from `A1` to the last
+        # cell (i.e., modifies the worksheet dimensions), so the `_cells`
+        # mapping is used instead (previously returned by the removed
+        # `Worksheet.get_cell_collection()` method).
+        for cell_i in worksheet._cells.values():
+            value_i = cell_i.value
+            if value_i is None:
+                continue
+            # Skip string conversion for values that are already strings.
+            length_i = (len(value_i) if isinstance(value_i, str)
+                        else len(str(value_i)))
+            # Note: lookup also adds column (with minimum width) if missing.
+            if length_i > widths[cell_i.column_letter]:
+                widths[cell_i.column_letter] = length_i
+        return dict(widths)
+
+    # Read-only worksheet (cells are streamed from the file).
+    min_column = worksheet.min_column
+    # Mapping from each column index (relative to first column) to width.
+    widths_by_index = collections.defaultdict(lambda: min_width)
+    for row_i in worksheet.iter_rows(min_col=min_column, values_only=True):
+        for j, value_ij in enumerate(row_i):
+            if value_ij is None:
+                continue
+            length_ij = (len(value_ij) if isinstance(value_ij, str)
+                         else len(str(value_ij)))
+            if length_ij > widths_by_index[j]:
+                widths_by_index[j] = length_ij
+    return {ox.utils.get_column_letter(min_column + j): width_j
+            for j, width_j in widths_by_index.items()}
 
 
 def get_defined_names_by_worksheet(workbook):
     '''
     .. versionadded:: 0.3
 
+    .. versionchanged:: 0.7
+        Accept path to Excel ``xlsx`` file.  Support ``openpyxl>=3.1``
+        defined name dictionaries.
+
     Parameters
     ----------
-    workbook : openpyxl.workbook.workbook.Workbook
+    workbook : openpyxl.workbook.workbook.Workbook or str
+        Excel workbook or path to Excel ``xlsx`` file.
+
+        If a path is specified, the workbook is loaded in read-only mode,
+        which avoids loading the cells and styles of every worksheet.
 
     Returns
     -------
@@ -351,16 +993,32 @@ def get_defined_names_by_worksheet(workbook):
              'Bar sheet': {'Some bar range': '$I$2:$I$3',
                            'Some bar cell': '$K$2'}}
     '''
-    defined_name_tuples = \
-        sorted([tuple(it.chain(*[(sheet_name_i, defined_name_i.name, range_i)
-                                 for sheet_name_i, range_i in
-                                 defined_name_i.destinations]))
-                for defined_name_i in workbook.defined_names.definedName])
-
-    return dict([(sheet_name_i,
-                  dict([tuple_ij[1:] for tuple_ij in defined_names_group_i]))
-                 for sheet_name_i, defined_names_group_i in
-                 it.groupby(defined_name_tuples, lambda n: n[0])])
+    if not isinstance(workbook, ox.Workbook):
+        workbook = ox.load_workbook(workbook, read_only=True, data_only=True,
+                                    keep_links=False)
+        try:
+            return get_defined_names_by_worksheet(workbook)
+        finally:
+            # Read-only workbooks keep the file open until explicitly closed.
+            workbook.close()
+
+    if hasattr(workbook.defined_names, 'definedName'):
+        # `openpyxl<3.1`: all defined names (including worksheet-scoped
+        # names) are stored in a single list.
+        defined_name_objs = workbook.defined_names.definedName
+    else:
+        # `openpyxl>=3.1`: defined names are stored in dictionaries, with
+        # worksheet-scoped names stored in the corresponding worksheet.
+        defined_name_objs = list(workbook.defined_names.values())
+        for worksheet_i in workbook.worksheets:
+            defined_name_objs.extend(getattr(worksheet_i, 'defined_names',
+                                             {}).values())
+
+    defined_names = collections.defaultdict(dict)
+    for defined_name_i in defined_name_objs:
+        for sheet_name_ij, range_ij in defined_name_i.destinations:
+            defined_names[sheet_name_ij][defined_name_i.name] = range_ij
+    return dict(defined_names)
 
 
 def extract_worksheet_xml(xlsx_path, worksheet_path):
@@ -373,14 +1031,19 @@ def extract_worksheet_xml(xlsx_path, worksheet_path):
     >>>> from openpyxl_helpers import extract_worksheet_xml
     >>>>
     >>>> template_root = extract_worksheet_xml(template_path, worksheet_path='xl/worksheets/sheet1.xml')
-    >>>> print lxml.etree.tostring(template_root, pretty_print=True)
+    >>>> print(lxml.etree.tostring(template_root, pretty_print=True))
 
     .. versionadded:: 0.4
 
+    .. versionchanged:: 0.7
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading (see
+        :func:`load_extension_lists`).
     worksheet_path : str
         Path to worksheet, e.g., ``path`` attribute of an
         ``openpyxl.worksheet.worksheet.Worksheet`` instance.
@@ -390,13 +1053,14 @@ def extract_worksheet_xml(xlsx_path, worksheet_path):
     lxml.etree._Element
         XML element for specified worksheet document.
     '''
-    with zipfile.ZipFile(xlsx_path, mode='r') as input_zip:
+    with _open_xlsx(xlsx_path) as input_zip:
         if worksheet_path.startswith('/'):
             worksheet_path = worksheet_path[1:]
-        return lxml.etree.fromstring(input_zip.read(worksheet_path))
+        return lxml.etree.fromstring(input_zip.read(worksheet_path),
+                                     _XML_PARSER)
 
 
-def load_charts(xlsx_path):
+def load_charts(xlsx_path, max_workers=None):
     '''
     Load charts in an Excel spreadsheet.
 
@@ -409,6 +1073,11 @@ def load_charts(xlsx_path):
 
     .. versionadded:: 0.5
 
+    .. versionchanged:: 0.7
+        Add :data:`max_workers` keyword argument.  Worksheets are processed
+        concurrently.
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     See also
     --------
     :func:`update_charts`, :func:`load_data_validations`,
@@ -416,8 +1085,13 @@ def load_charts(xlsx_path):
 
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading (see
+        :func:`load_extension_lists`).
+    max_workers : int, optional
+        Maximum number of worksheets to process concurrently (default:
+        ``concurrent.futures.ThreadPoolExecutor`` default).
 
     Returns
     -------
@@ -427,52 +1101,53 @@ def load_charts(xlsx_path):
         elements.
     '''
     # Open Excel file.
-    with zipfile.ZipFile(xlsx_path, mode='r') as input_:
-        # Get mapping from each worksheet filename to corresponding `ZipInfo`
-        # object.
-        zip_info_by_filenames = {ph.path(v.filename): v
-                                 for v in input_.filelist}
+    with _open_xlsx(xlsx_path) as input_:
+        # Mapping from each filename to corresponding `ZipInfo` object.
+        zip_info_by_filenames = input_.NameToInfo
         # Copy fully chart-related files into zip file.
         chart_filenames = [filename_i for filename_i in zip_info_by_filenames
-                           if any([any(filename_i.parent.startswith(p)
-                                       for p in ('xl/charts', 'xl/drawings',
-                                                 'xl/worksheets/_rels')),
-                                   ])]
+                           if filename_i.startswith(_CHART_PREFIXES)]
         chart_files = {zip_info_by_filenames[filename_i]:
                        input_.read(filename_i)
                        for filename_i in chart_filenames}
+
+        # Find drawing XML element (or `None` if the worksheet does not
+        # contain a drawing element) in each worksheet.
+        drawings = _load_worksheets(input_, lambda data:
+                                    _find_worksheet_child(data, _DRAWING_TAG),
+                                    max_workers)
+
         # Merge chart-related elements into worksheets and content types files.
         for filename_i in zip_info_by_filenames:
             if filename_i == '[Content_Types].xml':
-                xml_root = lxml.etree.fromstring(input_.read(filename_i))
+                with input_.open(zip_info_by_filenames[filename_i]) as data_i:
+                    xml_root = lxml.etree.parse(data_i,
+                                                _XML_PARSER).getroot()
                 elements_i = []
                 content_types = ["application/vnd.openxmlformats-"
                                  "officedocument.drawing+xml",
                                  "application/vnd.openxmlformats-"
                                  "officedocument.drawingml.chart+xml"]
                 for content_type_i in content_types:
-                    elements_i += xml_root.xpath('CONTYPES_NS:Override'
-                                                 '[@ContentType="{}"]'
-                                                 .format(content_type_i),
-                                                 namespaces=EXCEL_NAMESPACES)
-            elif filename_i.startswith('xl/worksheets/sheet'):
-                xml_root = lxml.etree.fromstring(input_.read(filename_i))
-                elements_i = xml_root.xpath('SHEET_MAIN_NS:drawing',
-                                            namespaces=EXCEL_NAMESPACES)
+                    elements_i += _XPATH_CONTENT_TYPE_OVERRIDES(
+                        xml_root, content_type=content_type_i)
+            elif filename_i in drawings:
+                drawing_i = drawings[filename_i]
+                elements_i = [] if drawing_i is None else [drawing_i]
             else:
                 continue
             if elements_i:
                 logger.debug('Merge chart-related elements into: %s',
                              filename_i)
                 chart_files[zip_info_by_filenames[filename_i]] = elements_i
-                if logger.LEVEL >= logging.DEBUG:
+                if logger.isEnabledFor(logging.DEBUG):
                     for element_i in elements_i:
                         logger.debug(' - %s', lxml.etree
                                      .tostring(element_i, pretty_print=True))
     return chart_files
 
 
-def update_charts(xlsx_path, chart_files):
+def update_charts(xlsx_path, chart_files, output=None, compresslevel=1):
     '''
     Update charts in an Excel spreadsheet.
 
@@ -485,6 +1160,12 @@ def update_charts(xlsx_path, chart_files):
 
     .. versionadded:: 0.5
 
+    .. versionchanged:: 0.7
+        Add :data:`output` and :data:`compresslevel` keyword arguments.
+        Files that are not modified are copied to the output file without
+        being decompressed.
+        Accept ``zipfile.ZipFile`` as :data:`xlsx_path`.
+
     See also
     --------
     :func:`load_charts`, :func:`load_extension_lists`,
@@ -492,62 +1173,79 @@ def update_charts(xlsx_path, chart_files):
 
     Parameters
     ----------
-    xlsx_path : str
-        Path to Excel ``xlsx`` file.
+    xlsx_path : str, file-like, or zipfile.ZipFile
+        Path to Excel ``xlsx`` file, seekable file-like object, or Excel
+        ``xlsx`` ZIP file open for reading (see
+        :func:`load_extension_lists`).
     chart_files : dict
         Mapping from the name of each chart-related file in the Excel
         spreadsheet to the corresponding file contents (as bytes) or XML
         elements.
+    output : str or file-like, optional
+        Output path or file-like object to write modified Excel ``.xlsx`` file
+        to.
+    compresslevel : int, optional
+        Compression level (``0``-``9``) for modified files (default: ``1``,
+        i.e., fastest; use ``9`` for smallest output).  Files that are not
+        modified keep their original compression.
 
     Returns
     -------
     bytes
-        Modified Excel ``.xlsx`` file contents as a bytes string.
-    '''
-    chart_filenames = {zip_info_i.filename for zip_info_i in chart_files}
-
-    with io.BytesIO() as output:
-        with zipfile.ZipFile(output, mode='w',
-                             compression=zipfile.ZIP_DEFLATED) as output_zip:
-            # - Read existing file
-            # - Copy all existing files to in-memory zip file.
-            with zipfile.ZipFile(xlsx_path, mode='r') as input_:
-                zip_infos_by_filename = {ph.path(v.filename): v
-                                         for v in input_.filelist}
-                for filename_i, zip_info_i in zip_infos_by_filename.iteritems():
-                    if filename_i in chart_filenames:
-                        # Skip existing chart files.
-                        continue
-
-                    # Worksheet file has no extension list.  Use original
-                    # worksheet contents.
-                    contents_i = input_.read(filename_i)
-
-                    # Write worksheet contents to output zip.
-                    output_zip.writestr(filename_i, contents_i,
-                                        zip_info_i.compress_type)
-
-                # - Restore/copy chart-related files to in-memory zip file.
-                for zip_info_i, contents_i in chart_files.iteritems():
-                    if isinstance(contents_i, list):
-                        logger.debug('Merge elements into: %s',
-                                     zip_info_i.filename)
-                        filename_i = zip_info_i.filename
-                        # Start with original worksheet contents.
-                        xml_source_i = input_.read(filename_i)
-                        xml_root = lxml.etree.fromstring(xml_source_i)
-                        for element_ij in contents_i:
-                            xml_root.append(element_ij)
-                        output_zip.writestr(zip_info_i.filename,
-                                            lxml.etree.tostring(xml_root),
-                                            zip_info_i.compress_type)
-                    else:
-                        logger.debug('Restore: %s', zip_info_i.filename)
-                        # Write worksheet contents to output zip.
-                        output_zip.writestr(zip_info_i.filename, contents_i,
-                                            zip_info_i.compress_type)
-            output_zip.close()
-        return output.getvalue()
+        Modified Excel ``.xlsx`` file contents as a bytes string (only if
+        :data:`output` is not specified).
+    '''
+    if output is None:
+        with io.BytesIO() as output:
+            update_charts(xlsx_path, chart_files, output=output,
+                          compresslevel=compresslevel)
+            return output.getvalue()
+
+    # Mapping from each file name to list of elements to append to the
+    # existing file contents.
+    edits = {zip_info_i.filename: contents_i
+             for zip_info_i, contents_i in chart_files.items()
+             if isinstance(contents_i, list)}
+    # Mapping from each file name to `(ZipInfo, contents)` for files to
+    # restore (i.e., replace or add).
+    restores = {zip_info_i.filename: (zip_info_i, contents_i)
+                for zip_info_i, contents_i in chart_files.items()
+                if not isinstance(contents_i, list)}
+
+    # Open input file first, so no output is written if it cannot be read.
+    with _open_xlsx(xlsx_path) as input_, \
+            _open_output_zip(output, compresslevel) as output_zip:
+        # - Read existing file
+        # - Merge/restore chart-related files and copy all other existing
+        #   files to output zip file (in a single pass).
+        for filename_i, zip_info_i in input_.NameToInfo.items():
+            if filename_i in edits:
+                logger.debug('Merge elements into: %s', filename_i)
+                # Start with original file contents.
+                with input_.open(zip_info_i) as source_i:
+                    xml_tree = lxml.etree.parse(source_i, _XML_PARSER)
+                xml_root = xml_tree.getroot()
+                for element_ij in edits[filename_i]:
+                    xml_root.append(element_ij)
+                with output_zip.open(_copy_zip_info(zip_info_i,
+                                                    compresslevel),
+                                     mode='w') as target_i:
+                    xml_tree.write(target_i, **_XML_WRITE_OPTIONS)
+            elif filename_i in restores:
+                logger.debug('Restore: %s', filename_i)
+                zip_info_ij, contents_ij = restores.pop(filename_i)
+                output_zip.writestr(_copy_zip_info(zip_info_ij,
+                                                   compresslevel),
+                                    contents_ij)
+            else:
+                # Copy original (compressed) file contents to output zip.
+                _copy_zip_member(input_, output_zip, zip_info_i)
+
+        # - Restore chart-related files that are not in the existing file.
+        for filename_i, (zip_info_i, contents_i) in restores.items():
+            logger.debug('Restore: %s', filename_i)
+            output_zip.writestr(_copy_zip_info(zip_info_i, compresslevel),
+                                contents_i)
 
 
 def create_chart_demo_workbook(xlsx_path):
@@ -559,6 +1257,10 @@ def create_chart_demo_workbook(xlsx_path):
 
     .. versionadded:: 0.6
 
+    .. versionchanged:: 0.7
+        Import ``numpy`` and ``pandas`` on first use (they are only required
+        by this function).
+
     Parameters
     ----------
     xlsx_path : str
@@ -572,6 +1274,11 @@ def create_chart_demo_workbook(xlsx_path):
         Allows, for example, easy opening of document using the ``launch()``
         method.
     '''
+    # Only required for demo, so import on first use to avoid import cost for
+    # other functions.
+    import numpy as np
+    import pandas as pd
+
     xlsx_path = ph.path(xlsx_path)
     with pd.ExcelWriter(xlsx_path, engine='openpyxl') as test_writer:
         workbook = test_writer.book
@@ -579,10 +1286,17 @@ def create_chart_demo_workbook(xlsx_path):
         workbook.create_sheet('My Chart')
 
         N = 100
-        for i, label_i in enumerate(('My', 'Your', 'His', 'Her')):
-            s_data_i = pd.Series(np.random.rand(N)) * (i + 1)
-            s_data_i.to_excel(test_writer, sheet_name='{} Data'
-                              .format(label_i), header=False)
+        labels = ('My', 'Your', 'His', 'Her')
+        # Generate data for all worksheets in a single vectorized call, with
+        # the values in each column scaled by the column number.
+        data = np.random.rand(N, len(labels)) * np.arange(1, len(labels) + 1)
+        for i, label_i in enumerate(labels):
+            # Append rows directly (same layout as `Series.to_excel()`
+            # without a header, i.e., index in the first column) to avoid
+            # `pandas` per-cell formatting overhead.
+            sheet_i = workbook.create_sheet('{} Data'.format(label_i))
+            for j, value_ij in enumerate(data[:, i].tolist()):
+                sheet_i.append((j, value_ij))
 
         worksheets = dict(zip(workbook.sheetnames, workbook.worksheets))
 
@@ -590,7 +1304,7 @@ def create_chart_demo_workbook(xlsx_path):
         chart.x_axis.title = 'Time (s)'
         chart.y_axis.title = 'Current (A)'
 
-        for name_i, sheet_i in worksheets.iteritems():
+        for name_i, sheet_i in worksheets.items():
             if name_i == 'My Chart':
                 continue
             x = ox.chart.Reference(sheet_i, min_col=1, min_row=1, max_row=N)
@@ -0,0 +1,34 @@
+import io
+
+import openpyxl as ox
+
+from openpyxl_helpers import get_column_widths
+
+
+def _workbook():
+    workbook = ox.Workbook()
+    worksheet = workbook.active
+    # Data does not start in column `A`.
+    worksheet['C3'] = 'hello world'
+    worksheet['C4'] = 12345
+    worksheet['D5'] = 'abcde'
+    return workbook
+
+
+def test_get_column_widths():
+    worksheet = _workbook().active
+    assert get_column_widths(worksheet) == {'C': 11, 'D': 5}
+    # Worksheet dimensions must not be modified.
+    assert worksheet.dimensions == 'C3:D5'
+    assert get_column_widths(worksheet, min_width=8) == {'C': 11, 'D': 8}
+
+
+def test_get_column_widths_read_only():
+    data = io.BytesIO()
+    _workbook().save(data)
+    data.seek(0)
+    workbook = ox.load_workbook(data, read_only=True)
+    try:
+        assert get_column_widths(workbook.active) == {'C': 11, 'D': 5}
+    finally:
+        workbook.close()
@@ -0,0 +1,278 @@
+import io
+import warnings
+import zipfile
+
+import lxml.etree
+import openpyxl as ox
+from openpyxl.chart import BarChart, Reference
+from openpyxl.worksheet.datavalidation import DataValidation
+import pytest
+
+import openpyxl_helpers as oh
+
+
+SHEET_MAIN_NS = oh.EXCEL_NAMESPACES['SHEET_MAIN_NS']
+SHEET1 = 'xl/worksheets/sheet1.xml'
+EXTENSION_LIST = (b'<extLst><ext uri="{CCE6A557-97BC-4b89-ADB6-D9C93CAAB3DF}" '
+                  b'xmlns:x14="http://schemas.microsoft.com/office/'
+                  b'spreadsheetml/2009/9/main"><x14:dataValidations '
+                  b'count="0"/></ext></extLst>')
+# Worksheet with markup that looks like worksheet children inside a comment
+# and inside a CDATA section.
+OPAQUE_WORKSHEET = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="%s"><dimension ref="A1"/><sheetData>'
+    b'<row r="1"><c r="A1" t="inlineStr"><is><t>'
+    b'<![CDATA[<dataValidations count="7"/><extLst/>]]></t></is></c></row>'
+    b'</sheetData><!-- <dataValidations count="9"/><extLst/> -->'
+    b'<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5"'
+    b' footer="0.5"/></worksheet>' % SHEET_MAIN_NS.encode('utf8'))
+
+
+class NonSeekableWriter(io.RawIOBase):
+    '''Write-only stream that does not support ``seek()`` or ``tell()``.'''
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+
+def make_workbook(xlsx_path, validations=True, chart=True):
+    workbook = ox.Workbook()
+    worksheet = workbook.active
+    worksheet.title = 'Data'
+    for i in range(1, 50):
+        worksheet.append([i, 'x' * (i % 7), i * 1.5])
+    if validations:
+        data_validation = DataValidation(type='list', formula1='"a,b,c"')
+        worksheet.add_data_validation(data_validation)
+        data_validation.add('B1:B10')
+    chart_sheet = workbook.create_sheet('Chart')
+    chart_sheet['A1'] = 'hello'
+    if chart:
+        bar_chart = BarChart()
+        bar_chart.add_data(Reference(worksheet, min_col=1, min_row=1,
+                                     max_row=10))
+        chart_sheet.add_chart(bar_chart, 'C3')
+    workbook.save(str(xlsx_path))
+    return xlsx_path
+
+
+def rewrite_members(xlsx_path, output, update=lambda filename, data: data):
+    '''Rewrite each member of ``xlsx_path`` to ``output`` through ``update``.
+    '''
+    with zipfile.ZipFile(str(xlsx_path)) as input_, \
+            zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as output_:
+        for zip_info_i in input_.infolist():
+            with output_.open(zipfile.ZipInfo(zip_info_i.filename,
+                                              zip_info_i.date_time),
+                              mode='w') as target_i:
+                target_i.write(update(zip_info_i.filename,
+                                      input_.read(zip_info_i)))
+
+
+def append_extension_list(filename, data):
+    if filename == SHEET1:
+        end = data.rfind(b'</worksheet>')
+        data = data[:end] + EXTENSION_LIST + data[end:]
+    return data
+
+
+def check_xlsx(data):
+    '''Check ZIP integrity and return workbook reloaded by ``openpyxl``.'''
+    with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+        assert zip_file.testzip() is None
+        names = zip_file.namelist()
+        assert len(names) == len(set(names))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return ox.load_workbook(io.BytesIO(data))
+
+
+def read_member(data, filename):
+    with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+        return zip_file.read(filename)
+
+
+def test_extension_lists_round_trip(tmp_path):
+    source = make_workbook(tmp_path / 'base.xlsx')
+    with_extension = tmp_path / 'extension.xlsx'
+    rewrite_members(source, str(with_extension), append_extension_list)
+    stripped = make_workbook(tmp_path / 'stripped.xlsx')
+
+    extension_lists = oh.load_extension_lists(str(with_extension))
+    assert extension_lists[SHEET1] is not None
+    data = oh.update_extension_lists(str(stripped), extension_lists)
+
+    check_xlsx(data)
+    worksheet = lxml.etree.fromstring(read_member(data, SHEET1))
+    assert worksheet[-1].tag == '{%s}extLst' % SHEET_MAIN_NS
+    assert oh.load_extension_lists(io.BytesIO(data)) \
+        .keys() == extension_lists.keys()
+
+
+def test_data_validations_round_trip(tmp_path):
+    source = make_workbook(tmp_path / 'base.xlsx')
+    stripped = make_workbook(tmp_path / 'stripped.xlsx', validations=False)
+
+    data_validations = oh.load_data_validations(str(source))
+    assert data_validations[SHEET1] is not None
+    data = oh.update_data_validations(str(stripped), data_validations)
+
+    workbook = check_xlsx(data)
+    validations = workbook['Data'].data_validations.dataValidation
+    assert [str(v.sqref) for v in validations] == ['B1:B10']
+    assert validations[0].formula1 == '"a,b,c"'
+
+
+def test_charts_round_trip(tmp_path):
+    source = make_workbook(tmp_path / 'base.xlsx')
+    stripped = tmp_path / 'stripped.xlsx'
+    # `openpyxl` drops existing charts when saving a loaded workbook.
+    ox.load_workbook(str(source)).save(str(stripped))
+
+    charts = oh.load_charts(str(source))
+    data = oh.update_charts(str(stripped), charts)
+
+    workbook = check_xlsx(data)
+    assert len(workbook['Chart']._charts) == 1
+    with zipfile.ZipFile(str(source)) as source_zip, \
+            zipfile.ZipFile(io.BytesIO(data)) as output_zip:
+        chart_names = [name for name in source_zip.namelist()
+                       if name.startswith('xl/charts/')]
+        assert chart_names
+        for name in chart_names:
+            assert output_zip.read(name) == source_zip.read(name)
+
+
+def test_copy_data_descriptor_members(tmp_path):
+    source = make_workbook(tmp_path / 'base.xlsx')
+    # Members written to a non-seekable stream use data descriptors (flag
+    # 0x08) instead of sizes/CRC in the local file header.
+    writer = NonSeekableWriter()
+    rewrite_members(source, writer)
+    with zipfile.ZipFile(io.BytesIO(bytes(writer.data))) as zip_file:
+        assert all(zip_info.flag_bits & 0x08
+                   for zip_info in zip_file.infolist())
+
+    data_validations = oh.load_data_validations(str(source))
+    data = oh.update_data_validations(io.BytesIO(bytes(writer.data)),
+                                      data_validations)
+
+    check_xlsx(data)
+    with zipfile.ZipFile(str(source)) as source_zip, \
+            zipfile.ZipFile(io.BytesIO(data)) as output_zip:
+        # Members other than updated worksheet are copied unchanged.
+        for zip_info in output_zip.infolist():
+            if zip_info.filename != SHEET1:
+                assert output_zip.read(zip_info) == \
+                    source_zip.read(zip_info.filename)
+
+
+def test_non_seekable_output(tmp_path):
+    source = make_workbook(tmp_path / 'base.xlsx')
+    stripped = make_workbook(tmp_path / 'stripped.xlsx', validations=False)
+
+    writer = NonSeekableWriter()
+    oh.update_data_validations(str(stripped),
+                               oh.load_data_validations(str(source)),
+                               output=writer)
+
+    workbook = check_xlsx(bytes(writer.data))
+    assert len(workbook['Data'].data_validations.dataValidation) == 1
+
+
+def test_prefixed_worksheet_fallbacks():
+    worksheet_xml = (b'<x:worksheet xmlns:x="%s"><x:sheetData/>'
+                     b'<x:dataValidations count="1"/>%s</x:worksheet>' %
+                     (SHEET_MAIN_NS.encode('utf8'),
+                      EXTENSION_LIST.replace(b'<extLst', b'<x:extLst')
+                      .replace(b'</extLst', b'</x:extLst')))
+    extension_list = oh._find_extension_list(worksheet_xml)
+    assert extension_list.tag == '{%s}extLst' % SHEET_MAIN_NS
+
+    element = lxml.etree.Element('{%s}dataValidations' % SHEET_MAIN_NS,
+                                 count='2')
+    root = lxml.etree.fromstring(oh._set_worksheet_child(worksheet_xml,
+                                                         element))
+    data_validations = root.findall('{%s}dataValidations' % SHEET_MAIN_NS)
+    assert [e.get('count') for e in data_validations] == ['2']
+
+    root = lxml.etree.fromstring(oh._append_worksheet_child(worksheet_xml,
+                                                            element))
+    assert root[-1].get('count') == '2'
+
+    # Prefixed child element under default namespace root element.
+    worksheet_xml = (b'<worksheet xmlns="%s" xmlns:x="%s"><sheetData/>'
+                     b'<x:dataValidations count="1"/></worksheet>' %
+                     ((SHEET_MAIN_NS.encode('utf8'), ) * 2))
+    root = lxml.etree.fromstring(oh._set_worksheet_child(worksheet_xml,
+                                                         element))
+    data_validations = root.findall('{%s}dataValidations' % SHEET_MAIN_NS)
+    assert [e.get('count') for e in data_validations] == ['2']
+
+
+def test_comment_and_cdata_helpers():
+    assert oh._find_extension_list(OPAQUE_WORKSHEET) is None
+
+    element = lxml.etree.Element('{%s}dataValidations' % SHEET_MAIN_NS,
+                                 count='1')
+    for update in (oh._set_worksheet_child, oh._append_worksheet_child):
+        output = update(OPAQUE_WORKSHEET, element)
+        root = lxml.etree.fromstring(output)
+        # Text and comment are unchanged.
+        assert b'<![CDATA[<dataValidations count="7"/><extLst/>]]>' in \
+            output or root.find('.//{%s}t' % SHEET_MAIN_NS).text == \
+            '<dataValidations count="7"/><extLst/>'
+        assert b'<!-- <dataValidations count="9"/><extLst/> -->' in output
+        data_validations = root.findall('{%s}dataValidations' %
+                                        SHEET_MAIN_NS)
+        assert [e.get('count') for e in data_validations] == ['1']
+
+
+@pytest.mark.parametrize('load,update', [
+    (oh.load_data_validations, oh.update_data_validations),
+    (oh.load_extension_lists, oh.update_extension_lists)])
+def test_comment_and_cdata_round_trip(tmp_path, load, update):
+    source = tmp_path / 'extension.xlsx'
+    rewrite_members(make_workbook(tmp_path / 'base.xlsx'), str(source),
+                    append_extension_list)
+    target = tmp_path / 'opaque.xlsx'
+    rewrite_members(make_workbook(tmp_path / 'stripped.xlsx',
+                                  validations=False), str(target),
+                    lambda filename, data: OPAQUE_WORKSHEET
+                    if filename == SHEET1 else data)
+
+    data = update(str(target), load(str(source)))
+
+    workbook = check_xlsx(data)
+    assert workbook['Data']['A1'].value == \
+        '<dataValidations count="7"/><extLst/>'
+    worksheet_xml = read_member(data, SHEET1)
+    assert b'<!-- <dataValidations count="9"/><extLst/> -->' in \
+        worksheet_xml
+    root = lxml.etree.fromstring(worksheet_xml)
+    tag = root[-1].tag
+    assert tag in ('{%s}dataValidations' % SHEET_MAIN_NS,
+                   '{%s}extLst' % SHEET_MAIN_NS)
+    assert len(root.findall(tag)) == 1
+
+
+def test_no_partial_output(tmp_path):
+    output = tmp_path / 'output.xlsx'
+    with pytest.raises(FileNotFoundError):
+        oh.update_data_validations(str(tmp_path / 'missing.xlsx'), {},
+                                   output=str(output))
+    assert not output.exists()
+
+    source = make_workbook(tmp_path / 'base.xlsx')
+    # Invalid element makes worksheet update fail in worker thread.
+    with pytest.raises(ValueError):
+        oh.update_data_validations(str(source), {SHEET1: object()},
+                                   output=str(output))
+    assert not output.exists()